@@ -5,9 +5,13 @@ Simula o comportamento do gerenciamento de E/S em um sistema operacional,
 utilizando interrupções para lidar com eventos de hardware.
 """
 
+from collections import deque
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import Deque, List, NamedTuple, Optional, Dict, Any, Set, TextIO, Tuple
+import heapq
+import itertools
 import random
+import sys
 from datetime import datetime
 
 
@@ -18,72 +22,116 @@ class Prioridade(Enum):
     BAIXA = 3
 
 
+# Nome de cada nível de prioridade, indexado pelo valor inteiro (usado só no log)
+_NOMES_PRIORIDADE = ("", "Alta", "Média", "Baixa")
+
+
+# Códigos dos eventos registrados no log
+EV_INIT = 0
+EV_END = 1
+EV_MULTIPLAS = 2
+EV_ADICIONADA = 3
+EV_CONTINUACAO = 4
+EV_OK = 5
+EV_RETOMADO = 6
+EV_INTERRUPCAO = 7
+EV_CONTEXTO = 8
+EV_INICIO_TRATAMENTO = 9
+EV_EXEC_NORMAL = 10
+
+# Formato de cada evento; a formatação só ocorre ao exibir/salvar o log
+_FORMATOS_EVENTO = {
+    codigo: "[Tempo {:02d}] - " + formato
+    for codigo, formato in {
+        EV_INIT: "[INIT] Simulacao iniciada.",
+        EV_END: "[END] Simulacao finalizada.",
+        EV_MULTIPLAS: "[!] MULTIPLAS INTERRUPCOES simultaneas: {} (teste de prioridade)",
+        EV_ADICIONADA: "[+] Interrupcao de {} adicionada a fila.",
+        EV_CONTINUACAO: "[>] Continuando tratamento do {} ({} ciclos restantes)",
+        EV_OK: "[OK] Interrupcao tratada. Restaurando contexto (PC={}).",
+        EV_RETOMADO: "[<] Processo principal retomado (proxima instrucao: {})",
+        EV_INTERRUPCAO: "[*] Interrupcao: {} (Prioridade: {}) - Latencia: {}u",
+        EV_CONTEXTO: "    -> Armazenando contexto: PC={}, Status='salvo'",
+        EV_INICIO_TRATAMENTO: "    -> Inicio do tratamento ({} ciclos estimados)",
+        EV_EXEC_NORMAL: "[ ] Processo principal em execucao (PC={})",
+    }.items()
+}
+
+# Seção de estatísticas do arquivo de log, preenchida com format_map
+_ESTATISTICAS_TEMPLATE = (
+    "\n" + "=" * 80 + "\n"
+    "ESTATÍSTICAS:\n"
+    + "-" * 80 + "\n"
+    "Total de interrupções: {total_interrupcoes}\n"
+    "  • Teclado (Alta prioridade):     {teclado:3d}\n"
+    "  • Impressora (Média prioridade): {impressora:3d}\n"
+    "  • Disco (Baixa prioridade):      {disco:3d}\n\n"
+    "Tempo total de tratamento: {tempo_total_tratamento} unidades\n"
+    "Ciclos de execução normal: {ciclos_execucao_normal}\n"
+    "Casos de múltiplas interrupções testados: {casos_prioridade_testados}\n"
+    + "=" * 80 + "\n"
+)
+
+
 class Dispositivo:
     """Representa um dispositivo de E/S."""
     
-    def __init__(self, nome: str, prioridade: Prioridade):
+    def __init__(self, nome: str, prioridade: Prioridade, id_disp: int):
         self.nome = nome
+        self.id_disp = id_disp  # Índice do dispositivo nos contadores do simulador
         self.prioridade = prioridade.value
-        self.tipo_prioridade = "Alta" if prioridade == Prioridade.ALTA else "Média" if prioridade == Prioridade.MEDIA else "Baixa"
 
 
-class Interrupcao:
-    """Representa uma interrupção na fila."""
-    
-    def __init__(self, prioridade: int, tempo_chegada: int, nome_dispositivo: str, tipo_prioridade: str):
-        self.prioridade = prioridade
-        self.tempo_chegada = tempo_chegada
-        self.nome_dispositivo = nome_dispositivo
-        self.tipo_prioridade = tipo_prioridade
+class Interrupcao(NamedTuple):
+    """
+    Representa uma interrupção na fila.
     
-    def __lt__(self, outro):
-        """Comparação para ordenação da fila."""
-        if self.prioridade != outro.prioridade:
-            return self.prioridade < outro.prioridade
-        return self.tempo_chegada < outro.tempo_chegada
+    A ordem dos campos define a ordenação na fila: 1º prioridade (menor = maior),
+    2º tempo de chegada e 3º seq, que desempata em ordem de inserção (FIFO).
+    """
+    prioridade: int
+    tempo_chegada: int
+    seq: int
+    nome_dispositivo: str
+    id_disp: int
 
 
 class GerenciadorInterrupcoes:
     """Gerencia interrupções com base em prioridades."""
     
     def __init__(self):
-        self.fila: List[Interrupcao] = []
+        self.fila: List[Interrupcao] = []  # Heap ordenado pelos campos de Interrupcao
+        self._seq = itertools.count()
+        # Índice (nome_dispositivo, tempo_chegada) das interrupções presentes na fila
+        self._chaves: Set[Tuple[str, int]] = set()
         self.contexto_salvo: Optional[Dict[str, Any]] = None
     
     def adicionar_interrupcao(self, tempo: int, dispositivo: Dispositivo) -> bool:
         """
-        Adiciona interrupção à fila com ordenação por prioridade.
+        Adiciona interrupção à fila de prioridades (heap).
         
         Returns:
             True se adicionada, False se já existe na fila
         """
         # Verifica se já existe uma interrupção deste dispositivo na mesma unidade de tempo
-        ja_existe = any(
-            i.nome_dispositivo == dispositivo.nome and 
-            i.tempo_chegada == tempo 
-            for i in self.fila
-        )
-        
-        if ja_existe:
+        chave = (dispositivo.nome, tempo)
+        if chave in self._chaves:
             return False
         
-        interrupcao = Interrupcao(dispositivo.prioridade, tempo, dispositivo.nome, dispositivo.tipo_prioridade)
-        self.fila.append(interrupcao)
-        
+        self._chaves.add(chave)
         # Ordena: 1º por prioridade (menor = maior), 2º por tempo de chegada (FIFO)
-        self.fila.sort()
+        heapq.heappush(self.fila, Interrupcao(dispositivo.prioridade, tempo, next(self._seq),
+                                              dispositivo.nome, dispositivo.id_disp))
         return True
     
     def proximo_interrupcao(self) -> Optional[Interrupcao]:
         """Retorna a próxima interrupção a ser processada."""
         if self.fila:
-            return self.fila.pop(0)
+            interrupcao = heapq.heappop(self.fila)
+            self._chaves.discard((interrupcao.nome_dispositivo, interrupcao.tempo_chegada))
+            return interrupcao
         return None
     
-    def tem_interrupcoes_pendentes(self) -> bool:
-        """Verifica se há interrupções aguardando na fila."""
-        return len(self.fila) > 0
-    
     def salvar_contexto(self, tempo: int, endereco_pc: int = 0) -> None:
         """Salva contexto do processo interrompido."""
         self.contexto_salvo = {
@@ -105,172 +153,254 @@ class GerenciadorInterrupcoes:
 class SimuladorIO:
     """Simulador principal de E/S com interrupções."""
     
+    ID_TECLADO = 0
+    ID_IMPRESSORA = 1
+    ID_DISCO = 2
+    
     DISPOSITIVOS = [
-        Dispositivo("Teclado", Prioridade.ALTA),
-        Dispositivo("Impressora", Prioridade.MEDIA),
-        Dispositivo("Disco", Prioridade.BAIXA),
+        Dispositivo("Teclado", Prioridade.ALTA, ID_TECLADO),
+        Dispositivo("Impressora", Prioridade.MEDIA, ID_IMPRESSORA),
+        Dispositivo("Disco", Prioridade.BAIXA, ID_DISCO),
     ]
     
-    def __init__(self, tempo_total: int = 50, arquivo_log: str = "log_simulacao.txt", prob_interrupcao: float = 0.25):
+    def __init__(self, tempo_total: int = 50, arquivo_log: str = "log_simulacao.txt", prob_interrupcao: float = 0.25,
+                 semente: Optional[int] = None, modo_streaming: bool = False):
+        """
+        Args:
+            tempo_total: Número de ciclos (unidades de tempo) simulados
+            arquivo_log: Caminho do arquivo de log
+            prob_interrupcao: Probabilidade de cada dispositivo interromper a cada ciclo
+            semente: Semente do gerador aleatório (None = não reprodutível)
+            modo_streaming: Se True, grava cada evento no arquivo à medida que ocorre,
+                sem guardar o log em memória; nesse modo o log NÃO é exibido na tela
+        """
         self.tempo = 0
         self.tempo_total = tempo_total
         self.gerenciador = GerenciadorInterrupcoes()
-        self.log = []
+        self.log: Deque[Tuple[Any, ...]] = deque()  # Eventos (tempo, codigo, *args)
         self.arquivo_log = arquivo_log
+        # Modo streaming: eventos gravados no arquivo à medida que ocorrem, sem guardar o log em memória
+        self.modo_streaming = modo_streaming
+        self._arquivo: Optional[TextIO] = None
         self.prob_interrupcao = prob_interrupcao  # Aumentada para testar melhor
         self.tempo_restante_tratamento = 0
-        self.interrupcao_atual = None
+        self.interrupcao_atual: Optional[Interrupcao] = None
         self.endereco_pc = 0
         self.ciclos_execucao_normal = 0
-        self.estatisticas = {
-            "Teclado": 0,
-            "Impressora": 0,
-            "Disco": 0,
-            "total_interrupcoes": 0,
-            "tempo_total_tratamento": 0,
-            "ciclos_execucao_normal": 0,
-            "casos_prioridade_testados": 0
-        }
+        # Estatísticas: interrupções tratadas por dispositivo (indexadas por id_disp) e totais
+        self.contagem_disp = [0] * len(self.DISPOSITIVOS)
+        self.total_interrupcoes = 0
+        self.tempo_total_tratamento = 0
+        self.casos_prioridade_testados = 0
+        # Gerador próprio com os métodos já ligados; a probabilidade vira um
+        # limiar inteiro para comparar com getrandbits(32)
+        self._rng = random.Random(semente)
+        self._getrandbits = self._rng.getrandbits
+        self._randint = self._rng.randint
+        self._limiar = int(prob_interrupcao * (1 << 32))
         
-    def gerar_interrupcoes(self) -> List[str]:
+    def gerar_interrupcoes(self) -> int:
         """
         Gera interrupções aleatórias.
         
         Returns:
-            Lista de nomes de dispositivos que geraram interrupção neste ciclo
+            Máscara de bits dos dispositivos que geraram interrupção neste ciclo
+            (bit id_disp ligado: 1 = Teclado, 2 = Impressora, 4 = Disco)
         """
-        dispositivos_ativados = []
-        for dispositivo in self.DISPOSITIVOS:
-            if random.random() < self.prob_interrupcao:
-                if self.gerenciador.adicionar_interrupcao(self.tempo, dispositivo):
-                    dispositivos_ativados.append(dispositivo.nome)
-        
-        return dispositivos_ativados
+        tempo = self.tempo
+        adicionar = self.gerenciador.adicionar_interrupcao
+        getrandbits = self._getrandbits
+        limiar = self._limiar
+        # Laço desenrolado sobre os três dispositivos fixos (ver _D0, _D1, _D2)
+        mascara = 0
+        if getrandbits(32) < limiar and adicionar(tempo, _D0):
+            mascara = 1
+        if getrandbits(32) < limiar and adicionar(tempo, _D1):
+            mascara |= 2
+        if getrandbits(32) < limiar and adicionar(tempo, _D2):
+            mascara |= 4
+        return mascara
     
     def processar_ciclo(self) -> None:
         """Executa um ciclo de simulação."""
+        # Atributos usados no ciclo ligados a variáveis locais
+        ger = self.gerenciador
+        registrar = self.registrar_evento
+        t = self.tempo
+        
         # 1. Tenta gerar novas interrupções neste ciclo
-        dispositivos_ativados = self.gerar_interrupcoes()
+        ativados = self.gerar_interrupcoes()
         
-        # Registra múltiplas interrupções simultâneas (caso de teste importante)
-        if len(dispositivos_ativados) > 1:
-            self.registrar_evento(f"[!] MULTIPLAS INTERRUPCOES simultaneas: {', '.join(dispositivos_ativados)} (teste de prioridade)")
-            self.estatisticas["casos_prioridade_testados"] += 1
-        elif len(dispositivos_ativados) == 1:
+        if ativados:
+            # Registra múltiplas interrupções simultâneas (caso de teste importante):
+            # mais de um bit ligado na máscara
+            if ativados & (ativados - 1):
+                registrar(EV_MULTIPLAS, _NOMES_MASCARA[ativados])
+                self.casos_prioridade_testados += 1
             # Verifica se há outras aguardando (fila não vazia)
-            if self.gerenciador.tem_interrupcoes_pendentes() and self.tempo_restante_tratamento == 0:
-                self.registrar_evento(f"[+] Interrupcao de {dispositivos_ativados[0]} adicionada a fila.")
+            elif ger.fila and self.tempo_restante_tratamento == 0:
+                registrar(EV_ADICIONADA, _NOMES_MASCARA[ativados])
 
         # 2. Verifica se está tratando uma interrupção
-        if self.tempo_restante_tratamento > 0:
-            self.registrar_evento(f"[>] Continuando tratamento do {self.interrupcao_atual['nome']} ({self.tempo_restante_tratamento} ciclos restantes)")
-            self.tempo_restante_tratamento -= 1
+        restante = self.tempo_restante_tratamento
+        if restante > 0:
+            registrar(EV_CONTINUACAO, self.interrupcao_atual.nome_dispositivo, restante)
+            restante -= 1
+            self.tempo_restante_tratamento = restante
             
             # Se terminou o tratamento agora
-            if self.tempo_restante_tratamento == 0:
-                ctx = self.gerenciador.restaurar_contexto()
-                self.registrar_evento(f"[OK] Interrupcao tratada. Restaurando contexto (PC={ctx['pc']}).")
-                self.registrar_evento(f"[<] Processo principal retomado (proxima instrucao: {ctx['pc'] + 1})")
+            if restante == 0:
+                pc = ger.restaurar_contexto()["pc"]
+                registrar(EV_OK, pc)
+                registrar(EV_RETOMADO, pc + 1)
                 self.interrupcao_atual = None
             return
 
         # 3. Se não está tratando, verifica fila (Scheduler)
-        proxima = self.gerenciador.proximo_interrupcao()
+        proxima = ger.proximo_interrupcao()
+        pc = self.endereco_pc
         
         if proxima:
             # Salva estatísticas
-            self.estatisticas[proxima.nome_dispositivo] += 1
-            self.estatisticas["total_interrupcoes"] += 1
+            self.contagem_disp[proxima.id_disp] += 1
+            self.total_interrupcoes += 1
             
             # Salva o contexto atual antes de tratar
-            self.gerenciador.salvar_contexto(self.tempo, self.endereco_pc)
+            ger.salvar_contexto(t, pc)
             
             # Configura o estado de "Tratando Interrupção"
-            self.interrupcao_atual = {
-                "nome": proxima.nome_dispositivo,
-                "prioridade": proxima.tipo_prioridade,
-                "tempo_chegada": proxima.tempo_chegada
-            }
-            self.tempo_restante_tratamento = random.randint(2, 4)
-            self.estatisticas["tempo_total_tratamento"] += self.tempo_restante_tratamento
+            self.interrupcao_atual = proxima
+            duracao = self._randint(2, 4)
+            self.tempo_restante_tratamento = duracao
+            self.tempo_total_tratamento += duracao
             
-            latencia = self.tempo - proxima.tempo_chegada
-            self.registrar_evento(f"[*] Interrupcao: {proxima.nome_dispositivo} (Prioridade: {proxima.tipo_prioridade}) - Latencia: {latencia}u")
-            self.registrar_evento(f"    -> Armazenando contexto: PC={self.endereco_pc}, Status='salvo'")
-            self.registrar_evento(f"    -> Inicio do tratamento ({self.tempo_restante_tratamento} ciclos estimados)")
+            registrar(EV_INTERRUPCAO, proxima.nome_dispositivo, _NOMES_PRIORIDADE[proxima.prioridade],
+                      t - proxima.tempo_chegada)
+            registrar(EV_CONTEXTO, pc)
+            registrar(EV_INICIO_TRATAMENTO, duracao)
         
         else:
             # 4. Se não há interrupções, o processo principal segue
             if self.ciclos_execucao_normal % 5 == 0:  # Log a cada 5 ciclos para não poluir
-                self.registrar_evento(f"[ ] Processo principal em execucao (PC={self.endereco_pc})")
-            self.endereco_pc += 1  # Simula incremento do PC
+                registrar(EV_EXEC_NORMAL, pc)
+            self.endereco_pc = pc + 1  # Simula incremento do PC
             self.ciclos_execucao_normal += 1
-            self.estatisticas["ciclos_execucao_normal"] += 1
     
-    def registrar_evento(self, evento: str) -> None:
-        """Registra evento no log (tela e arquivo)."""
-        mensagem = f"[Tempo {self.tempo:02d}] - {evento}"
-        self.log.append(mensagem)
-        print(mensagem)
+    def registrar_evento(self, codigo: int, *args: Any) -> None:
+        """
+        Registra evento no log.
+        
+        No modo normal guarda (tempo, codigo, *args) no buffer, sem formatá-lo;
+        no modo streaming formata e grava a linha direto no arquivo aberto.
+        """
+        if self._arquivo is None:
+            self.log.append((self.tempo, codigo, *args))
+        else:
+            self._arquivo.write(_FORMATOS_EVENTO[codigo].format(self.tempo, *args) + "\n")
+    
+    def linhas_log(self) -> List[str]:
+        """Formata os eventos registrados no buffer de log."""
+        formatos = _FORMATOS_EVENTO
+        return [formatos[evento[1]].format(evento[0], *evento[2:]) for evento in self.log]
+    
+    def _cabecalho_log(self) -> str:
+        """Monta o cabeçalho do arquivo de log (até o título do log de eventos)."""
+        parts = []
+        parts.append("=" * 80 + "\n")
+        parts.append("SIMULAÇÃO DE GERENCIAMENTO DE ENTRADA E SAÍDA COM INTERRUPÇÃO\n")
+        parts.append("=" * 80 + "\n")
+        parts.append(f"Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
+        parts.append(f"Tempo total de simulação: {self.tempo_total} unidades de tempo\n")
+        parts.append(f"Probabilidade de interrupção: {self.prob_interrupcao*100:.0f}%\n")
+        parts.append("=" * 80 + "\n\n")
+        
+        # Legenda
+        parts.append("LEGENDA:\n")
+        parts.append("  [!] = Multiplas interrupcoes simultaneas (teste de prioridade)\n")
+        parts.append("  [+] = Interrupcao adicionada a fila de espera\n")
+        parts.append("  [*] = Interrupcao sendo processada\n")
+        parts.append("  [>] = Continuacao do tratamento\n")
+        parts.append("  [OK] = Interrupcao finalizada\n")
+        parts.append("  [<] = Processo retomado\n")
+        parts.append("  [ ] = Execucao normal (processo principal)\n")
+        parts.append("=" * 80 + "\n\n")
+        
+        # Log de eventos
+        parts.append("LOG DE EVENTOS:\n")
+        parts.append("-" * 80 + "\n")
+        return "".join(parts)
+    
+    def _estatisticas_log(self) -> str:
+        """Monta a seção de estatísticas do arquivo de log."""
+        return _ESTATISTICAS_TEMPLATE.format_map({
+            "total_interrupcoes": self.total_interrupcoes,
+            "teclado": self.contagem_disp[self.ID_TECLADO],
+            "impressora": self.contagem_disp[self.ID_IMPRESSORA],
+            "disco": self.contagem_disp[self.ID_DISCO],
+            "tempo_total_tratamento": self.tempo_total_tratamento,
+            "ciclos_execucao_normal": self.ciclos_execucao_normal,
+            "casos_prioridade_testados": self.casos_prioridade_testados,
+        })
+    
+    def _abrir_log_streaming(self) -> None:
+        """Abre o arquivo de log e grava o cabeçalho; os eventos seguintes vão direto para ele."""
+        try:
+            self._arquivo = open(self.arquivo_log, 'w', encoding='utf-8', buffering=1 << 15)
+            self._arquivo.write(self._cabecalho_log())
+        except Exception as e:
+            print(f"✗ Erro ao abrir log: {e}")
+            self._arquivo = None
     
     def salvar_log_arquivo(self) -> None:
-        """Salva o log em arquivo de texto."""
+        """Salva o log em arquivo de texto (no modo streaming, só completa e fecha o arquivo)."""
         try:
-            with open(self.arquivo_log, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write("SIMULAÇÃO DE GERENCIAMENTO DE ENTRADA E SAÍDA COM INTERRUPÇÃO\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
-                f.write(f"Tempo total de simulação: {self.tempo_total} unidades de tempo\n")
-                f.write(f"Probabilidade de interrupção: {self.prob_interrupcao*100:.0f}%\n")
-                f.write("=" * 80 + "\n\n")
-                
-                # Legenda
-                f.write("LEGENDA:\n")
-                f.write("  [!] = Multiplas interrupcoes simultaneas (teste de prioridade)\n")
-                f.write("  [+] = Interrupcao adicionada a fila de espera\n")
-                f.write("  [*] = Interrupcao sendo processada\n")
-                f.write("  [>] = Continuacao do tratamento\n")
-                f.write("  [OK] = Interrupcao finalizada\n")
-                f.write("  [<] = Processo retomado\n")
-                f.write("  [ ] = Execucao normal (processo principal)\n")
-                f.write("=" * 80 + "\n\n")
-                
-                # Log de eventos
-                f.write("LOG DE EVENTOS:\n")
-                f.write("-" * 80 + "\n")
-                for linha in self.log:
-                    f.write(linha + "\n")
-                
-                # Estatísticas
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("ESTATÍSTICAS:\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Total de interrupções: {self.estatisticas['total_interrupcoes']}\n")
-                f.write(f"  • Teclado (Alta prioridade):     {self.estatisticas['Teclado']:3d}\n")
-                f.write(f"  • Impressora (Média prioridade): {self.estatisticas['Impressora']:3d}\n")
-                f.write(f"  • Disco (Baixa prioridade):      {self.estatisticas['Disco']:3d}\n\n")
-                f.write(f"Tempo total de tratamento: {self.estatisticas['tempo_total_tratamento']} unidades\n")
-                f.write(f"Ciclos de execução normal: {self.estatisticas['ciclos_execucao_normal']}\n")
-                f.write(f"Casos de múltiplas interrupções testados: {self.estatisticas['casos_prioridade_testados']}\n")
-                f.write("=" * 80 + "\n")
+            if self._arquivo is not None:
+                self._arquivo.write(self._estatisticas_log())
+                self._arquivo.close()
+            else:
+                # Monta o conteúdo completo e grava com uma única escrita
+                conteudo = "".join((
+                    self._cabecalho_log(),
+                    "\n".join(self.linhas_log()),
+                    "\n",
+                    self._estatisticas_log(),
+                ))
+                with open(self.arquivo_log, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.write(conteudo)
             
             print(f"\n✓ Log salvo em: {self.arquivo_log}")
         except Exception as e:
             print(f"✗ Erro ao salvar log: {e}")
+        finally:
+            self._arquivo = None
     
     def executar(self) -> None:
         """Executa a simulação completa."""
-        self.registrar_evento("[INIT] Simulacao iniciada.")
-        
-        while self.tempo < self.tempo_total:
-            self.processar_ciclo()
-            self.tempo += 1
-        
-        self.registrar_evento("[END] Simulacao finalizada.")
-        self.salvar_log_arquivo()
+        if self.modo_streaming:
+            self._abrir_log_streaming()
+        # O log é sempre salvo (e o arquivo do modo streaming fechado), mesmo se um ciclo falhar
+        try:
+            self.registrar_evento(EV_INIT)
+            
+            while self.tempo < self.tempo_total:
+                self.processar_ciclo()
+                self.tempo += 1
+            
+            self.registrar_evento(EV_END)
+            if self._arquivo is None:
+                sys.stdout.write("\n".join(self.linhas_log()) + "\n")
+        finally:
+            self.salvar_log_arquivo()
+
 
+# Dispositivos do simulador em ordem de id_disp, usados por gerar_interrupcoes
+_D0, _D1, _D2 = SimuladorIO.DISPOSITIVOS
 
+# Nomes dos dispositivos ("Teclado, Disco", ...) para cada máscara de gerar_interrupcoes
+_NOMES_MASCARA = tuple(
+    ", ".join(d.nome for d in SimuladorIO.DISPOSITIVOS if mascara >> d.id_disp & 1)
+    for mascara in range(1 << len(SimuladorIO.DISPOSITIVOS))
+)
 
 
 def main():